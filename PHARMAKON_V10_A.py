@@ -9,14 +9,31 @@ Focus: Detect epistemic positions, not simulate consciousness.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Tuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+from itertools import chain
+from typing import Dict, List, Optional, Tuple, Union
 import json
+import os
 from pathlib import Path
-from math import isclose
 import numpy as np
 from scipy.integrate import solve_ivp
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Pretty-printing switch: PHARMAKON_VERBOSE=0 silences the demo
+PHARMAKON_VERBOSE = os.environ.get("PHARMAKON_VERBOSE", "1") == "1"
+
 # ===========================================================================
 # 1. Slider Declarations (Typed Dataclasses)
 # ===========================================================================
@@ -74,6 +91,174 @@ class NarrativeSliders:
 # Master state dictionary (dynamic access)
 State = Dict[str, float]
 
+# Canonical state layout: every slider field plus the free-standing scalars
+_SLIDER_CLASSES = (BodySliders, AffectSliders, CognitiveSliders, BiasSliders, NarrativeSliders)
+_STATE_KEYS: Tuple[str, ...] = tuple(
+    f.name for dc in _SLIDER_CLASSES for f in fields(dc)
+) + ("Dogma_Fixation", "Delusionality")
+_KEY_INDEX: Dict[str, int] = {k: i for i, k in enumerate(_STATE_KEYS)}
+STATE_KEYS = _STATE_KEYS  # Public name: row order of simulate_trajectory output
+
+# Integer slot of every variable in a state vector: v[SliderIndex.Fear]
+SliderIndex = IntEnum("SliderIndex", [(k, i) for i, k in enumerate(_STATE_KEYS)])
+NUM_SLIDERS = len(SliderIndex)
+
+# Slider dataclass defaults in _STATE_KEYS order (free-standing scalars default to 0.0)
+_STATE_DEFAULTS = np.array(
+    [f.default for dc in _SLIDER_CLASSES for f in fields(dc)] + [0.0, 0.0],
+    dtype=np.float64,
+)
+
+_I_DK = _KEY_INDEX["Dunning_Kruger"]
+_I_OC = _KEY_INDEX["Overconfidence"]
+_I_MC = _KEY_INDEX["Meta_Cognition"]
+_I_LU = _KEY_INDEX["Lucidity"]
+_I_RO = _KEY_INDEX["Recursive_Overthinking"]
+_I_EO = _KEY_INDEX["Ego_Oscillation"]
+_I_COHERENCE = _KEY_INDEX["Coherence"]
+_I_CONTINUITY = _KEY_INDEX["Continuity"]
+_I_ARC = _KEY_INDEX["Arc"]
+_I_PROTAGONIST = _KEY_INDEX["Protagonist"]
+_I_DOGMA = _KEY_INDEX["Dogma_Fixation"]
+_I_DELUSIONALITY = _KEY_INDEX["Delusionality"]
+
+def state_to_vec(state: State) -> np.ndarray:
+    """Convert a state dictionary to a vector in `_STATE_KEYS` order.
+
+    Missing composite inputs are filled with 0.0, so composites of the
+    vector equal those of the dictionary; other missing keys take their
+    slider defaults. Unknown keys are ignored.
+    """
+    get = state.get
+    return np.fromiter(
+        (get(k, d) for k, d in zip(_STATE_KEYS, _DICT_FILL)),
+        dtype=np.float64,
+        count=len(_STATE_KEYS),
+    )
+
+def state_from_values(*values: float) -> np.ndarray:
+    """Build a state vector from positional values in `_STATE_KEYS` order.
+
+    Fast path for programmatic callers that already hold the numbers and
+    want to skip dictionary construction.
+    """
+    if len(values) != len(_STATE_KEYS):
+        raise ValueError(f"Expected {len(_STATE_KEYS)} values, got {len(values)}")
+    return np.array(values, dtype=np.float64)
+
+# (field name, slot) pairs per slider class, resolved once for pack_state
+_FIELD_SLOTS: Dict[type, Tuple[Tuple[str, int], ...]] = {
+    dc: tuple((f.name, _KEY_INDEX[f.name]) for f in fields(dc)) for dc in _SLIDER_CLASSES
+}
+
+def pack_state(*sliders, out: Optional[np.ndarray] = None, **scalars: float) -> np.ndarray:
+    """Write slider dataclasses straight into a state vector.
+
+    Avoids `asdict` (which deep-copies every field) and dictionary merges.
+
+    Args:
+        *sliders: BodySliders, AffectSliders, ... instances
+        out: Optional vector to fill in place; a fresh vector holding the
+            slider defaults is allocated when omitted
+        **scalars: Free-standing variables such as Dogma_Fixation=0.2
+
+    Returns:
+        State vector in `_STATE_KEYS` order
+    """
+    if out is None:
+        out = _STATE_DEFAULTS.copy()
+    for obj in sliders:
+        for name, slot in _FIELD_SLOTS[type(obj)]:
+            out[slot] = getattr(obj, name)
+    for name, value in scalars.items():
+        out[_KEY_INDEX[name]] = value
+    return out
+
+class StateBuilder:
+    """Constructors that assemble a state vector from the five slider groups."""
+
+    @classmethod
+    def from_sliders(
+        cls,
+        body: BodySliders,
+        affect: AffectSliders,
+        cognitive: CognitiveSliders,
+        bias: BiasSliders,
+        narrative: NarrativeSliders,
+        delusionality: float = 0.0,
+        dogma_fixation: float = 0.0,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Write one instance of every slider group into a single state vector.
+
+        Each group must be an instance of the slider class for its position,
+        so all NUM_SLIDERS slots are covered and the vector can be allocated
+        uninitialised and filled once; no dictionaries are built.
+
+        Args:
+            body, affect, cognitive, bias, narrative: Slider group instances
+            delusionality: Delusionality value
+            dogma_fixation: Dogma_Fixation value
+            out: Optional vector to fill in place
+
+        Returns:
+            State vector in `_STATE_KEYS` order
+
+        Raises:
+            TypeError: If a group is not of the expected slider class
+        """
+        groups = (body, affect, cognitive, bias, narrative)
+        for group, expected in zip(groups, _SLIDER_CLASSES):
+            if type(group) is not expected:
+                raise TypeError(
+                    f"Expected {expected.__name__}, got {type(group).__name__}"
+                )
+        if out is None:
+            out = np.empty(NUM_SLIDERS, dtype=np.float64)
+        pack_state(*groups, out=out)
+        out[_I_DELUSIONALITY] = delusionality
+        out[_I_DOGMA] = dogma_fixation
+        return out
+
+def vec_get(v: np.ndarray, name: str) -> float:
+    """Read one named variable from a state vector."""
+    return float(v[_KEY_INDEX[name]])
+
+class StateVector(Mapping):
+    """Read-only mapping view over a contiguous float64 state vector.
+
+    Stores the state in `_STATE_KEYS` order so numeric code can work on
+    `.values` directly while name-based callers keep dict-style access.
+    """
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray):
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+
+    @classmethod
+    def from_dict(cls, state: State) -> "StateVector":
+        return cls(state_to_vec(state))
+
+    def __getitem__(self, name: str) -> float:
+        return float(self.values[_KEY_INDEX[name]])
+
+    def __iter__(self):
+        return iter(_STATE_KEYS)
+
+    def __len__(self) -> int:
+        return len(_STATE_KEYS)
+
+    def to_dict(self) -> State:
+        return dict(zip(_STATE_KEYS, self.values.tolist()))
+
+def _as_vec(state) -> np.ndarray:
+    """Return the `_STATE_KEYS`-ordered vector for any supported state form."""
+    if isinstance(state, np.ndarray):
+        return state
+    if isinstance(state, StateVector):
+        return state.values
+    return state_to_vec(state)
+
 # ===========================================================================
 # 2. Composite Weights (AI-Ensemble Method)
 # ===========================================================================
@@ -106,38 +291,209 @@ _DEFAULT_WEIGHTS = {
 
 def _load_weights() -> Dict[str, Dict[str, float]]:
     """Load composite weights from JSON file or use defaults."""
-    if _WEIGHTS_FILE.exists():
+    try:
         with open(_WEIGHTS_FILE, 'r') as fh:
             return json.load(fh)
-    return _DEFAULT_WEIGHTS
+    except FileNotFoundError:
+        return _DEFAULT_WEIGHTS
 
 WEIGHTS = _load_weights()
 
 # Sanity check: each composite should sum ≈1.0
-for comp, vec in WEIGHTS.items():
-    s = sum(vec.values())
-    assert isclose(s, 1.0, rel_tol=1e-3), f"Weights for {comp} sum to {s}, expected 1.0"
+_W_SUMS = np.array([sum(vec.values()) for vec in WEIGHTS.values()])
+_W_BAD = ~np.isclose(_W_SUMS, 1.0, rtol=1e-3, atol=0.0)
+assert not _W_BAD.any(), (
+    f"Weights for {[c for c, bad in zip(WEIGHTS, _W_BAD) if bad]} "
+    f"sum to {_W_SUMS[_W_BAD].tolist()}, expected 1.0"
+)
+
+def _weights_to_array(vec: Dict[str, float], keys: Tuple[str, ...] = _STATE_KEYS) -> np.ndarray:
+    """Scatter a {key: weight} mapping into a dense vector aligned with `keys`.
+
+    Keys absent from the layout are dropped (they would read as 0.0 anyway).
+    """
+    index = {k: i for i, k in enumerate(keys)}
+    arr = np.zeros(len(keys), dtype=np.float64)
+    for k, w in vec.items():
+        if k in index:
+            arr[index[k]] = w
+    return arr
+
+# Dense composite weights aligned with _STATE_KEYS (built once at import)
+_W_ARR: Dict[str, np.ndarray] = {name: _weights_to_array(vec) for name, vec in WEIGHTS.items()}
+
+# (key, weight) pairs for the dictionary path of compute_composite
+_COMPOSITE_PAIRS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    name: tuple(vec.items()) for name, vec in WEIGHTS.items()
+}
+
+# Hot-path aliases so classifiers skip the name lookup entirely
+_W_STRESS = _W_ARR["stress"]
+_W_POS = _W_ARR["positive"]
+_W_BIAS_CASCADE = _W_ARR["bias_cascade"]
+
+# All composites stacked row-wise so one matrix-vector product scores them together
+_COMPOSITE_NAMES: Tuple[str, ...] = tuple(WEIGHTS)
+_COMPOSITE_WEIGHTS = np.vstack([_W_ARR[name] for name in _COMPOSITE_NAMES])
+
+# Fill values for keys a state dictionary leaves out: composite inputs read
+# as 0.0 (as in compute_composite), everything else takes its slider default
+_DICT_FILL = np.where(_COMPOSITE_WEIGHTS.any(axis=0), 0.0, _STATE_DEFAULTS)
 
 # ===========================================================================
 # 3. Helper Functions
 # ===========================================================================
 
-def compute_composite(name: str, state: State) -> float:
+def compute_composite(name: str, state: Union[State, StateVector, np.ndarray]) -> float:
     """Compute weighted composite score from state variables.
 
     Args:
         name: Composite name (e.g., 'stress', 'positive', 'bias_cascade')
-        state: Current state dictionary
+        state: Current state dictionary, StateVector or state vector
 
     Returns:
         Weighted sum of relevant state variables [0,1]
     """
-    vec = WEIGHTS[name]
-    return sum(state.get(k, 0.0) * w for k, w in vec.items())
+    if isinstance(state, (np.ndarray, StateVector)):
+        return compute_composite_vec(name, _as_vec(state))
+    total = 0.0
+    get = state.get
+    for k, w in _COMPOSITE_PAIRS[name]:
+        total += get(k, 0.0) * w
+    return total
+
+def compute_composite_vec(name: str, y: np.ndarray) -> float:
+    """Compute weighted composite score from a state vector.
+
+    Vector counterpart of `compute_composite`: a single dot product against
+    the precomputed weight array instead of per-key dict lookups.
+
+    Args:
+        name: Composite name (e.g., 'stress', 'positive', 'bias_cascade')
+        y: State vector laid out in `_STATE_KEYS` order
 
-def classify_triangle_position(state: State) -> Tuple[str, Dict[str, float]]:
+    Returns:
+        Weighted sum of relevant state variables [0,1]
+    """
+    return float(_W_ARR[name] @ y)
+
+def compute_composites(state: Union[State, StateVector, np.ndarray]) -> Dict[str, float]:
+    """Compute every composite score in one pass.
+
+    Args:
+        state: Current state dictionary, StateVector or state vector
+
+    Returns:
+        Dictionary of composite_name: score, in WEIGHTS order
+    """
+    if not isinstance(state, (np.ndarray, StateVector)):
+        return {name: compute_composite(name, state) for name in _COMPOSITE_NAMES}
+    values = _COMPOSITE_WEIGHTS @ _as_vec(state)
+    return dict(zip(_COMPOSITE_NAMES, values.tolist()))
+
+# Position score keys, in the row order of _POS_COEFFS
+_POSITION_KEYS: Tuple[str, ...] = (
+    "Position_1_Epistemic_Arrogance",
+    "Position_2_Meta_Awareness_Trap",
+    "Position_3_Integrated_Competence",
+)
+_POSITION_NAMES: Tuple[str, ...] = tuple(k.replace("_", " ") for k in _POSITION_KEYS)
+
+# Position scores as an affine map of the feature vector
+# [Dunning_Kruger, Overconfidence, Meta_Cognition, Lucidity,
+#  Recursive_Overthinking, Ego_Oscillation, bias_cascade]
+_POS_FEATURE_INDEX = np.array([_I_DK, _I_OC, _I_MC, _I_LU, _I_RO, _I_EO])
+_POS_COEFFS = np.array([
+    # Position 1: High DK + Overconfidence, low Meta-Cognition, low Lucidity
+    [0.2, 0.2, -0.3, -0.3, 0.0, 0.0, 0.0],
+    # Position 2: High Meta-Cognition, Lucidity, Overthinking; struggling with biases
+    [0.0, 0.0, 0.3, 0.3, 0.2, 0.0, 0.2],
+    # Position 3: High Meta-Cognition, Lucidity; low Overthinking, Ego Oscillation
+    [0.0, 0.0, 0.3, 0.3, -0.2, -0.2, 0.0],
+])
+_POS_CONST = np.array([0.6, 0.0, 0.4])
+
+def _position_weights(w_bias: np.ndarray) -> np.ndarray:
+    """Expand _POS_COEFFS into a dense [3, len(_STATE_KEYS)] weight matrix.
+
+    The bias cascade is itself linear in the state, so its column is folded
+    in through `w_bias` and scoring needs no intermediate feature vector.
+    """
+    weights = np.zeros((len(_POSITION_KEYS), len(_STATE_KEYS)))
+    weights[:, _POS_FEATURE_INDEX] = _POS_COEFFS[:, :6]
+    weights += np.outer(_POS_COEFFS[:, 6], w_bias)
+    return weights
+
+_POSITION_WEIGHTS = _position_weights(_W_BIAS_CASCADE)
+
+# (slot, weight) pairs of the bias cascade, for scalar reads of one state vector
+_BIAS_CASCADE_SLOTS: Tuple[Tuple[int, float], ...] = tuple(
+    (_KEY_INDEX[k], w) for k, w in WEIGHTS["bias_cascade"].items() if k in _KEY_INDEX
+)
+
+def _bias_cascade_list(x: List[float]) -> float:
+    """Bias cascade of a state held as a `_STATE_KEYS`-ordered list."""
+    total = 0.0
+    for i, w in _BIAS_CASCADE_SLOTS:
+        total += x[i] * w
+    return total
+
+def _position_scores(
+    dk: float, oc: float, mc: float, lu: float, ro: float, eo: float, bias_cascade: float
+) -> Tuple[float, float, float]:
+    """Scores of the three positions for one state, in _POSITION_KEYS order.
+
+    Scalar form of `_POSITION_WEIGHTS`, used for single states where array
+    dispatch would cost more than the arithmetic.
+    """
+    return (
+        # Position 1: Epistemic Arrogance
+        0.4 * (dk + oc) / 2.0 +  # High Dunning-Kruger + Overconfidence
+        0.3 * (1.0 - mc) +        # Low Meta-Cognition
+        0.3 * (1.0 - lu),         # Low Lucidity
+        # Position 2: Meta-Awareness Trap
+        0.3 * mc +                # High Meta-Cognition
+        0.3 * lu +                # High Lucidity
+        0.2 * ro +                # High Recursive Overthinking
+        0.2 * bias_cascade,       # Aware but struggling with biases
+        # Position 3: Integrated Competence
+        0.3 * mc +                # High Meta-Cognition
+        0.3 * lu +                # High Lucidity
+        0.2 * (1.0 - ro) +        # Low Recursive Overthinking
+        0.2 * (1.0 - eo),         # Low Ego Oscillation
+    )
+
+def classify_triangle_vec(v: np.ndarray) -> Tuple[int, Tuple[float, float, float]]:
+    """Classify epistemic position of a state vector (primary API).
+
+    Reads the six position variables by slot; no dictionaries are built.
+    See `classify_triangle_position` for the position definitions and
+    `classify_triangle_position_batch` for many states at once.
+
+    Args:
+        v: State vector laid out in `_STATE_KEYS` order
+
+    Returns:
+        Tuple of (position_code, position_scores) where position_code
+        indexes _POSITION_NAMES and position_scores follow _POSITION_KEYS
+    """
+    x = v.tolist()
+    scores = _position_scores(
+        x[_I_DK], x[_I_OC], x[_I_MC], x[_I_LU], x[_I_RO], x[_I_EO], _bias_cascade_list(x)
+    )
+
+    # Classify to position with highest score
+    return scores.index(max(scores)), scores
+
+def classify_triangle_position(
+    state: Union[State, StateVector, np.ndarray]
+) -> Tuple[str, Dict[str, float]]:
     """Classify epistemic position based on triangle model.
 
+    Vectors go through `classify_triangle_vec`. Dictionaries are scored
+    directly: missing sliders take their defaults, while the bias cascade
+    counts missing keys as 0.0 (see `compute_composite`).
+
     Position 1 (Epistemic Arrogance):
         High: Dunning_Kruger, Overconfidence
         Low: Meta_Cognition, Lucidity
@@ -155,54 +511,71 @@ def classify_triangle_position(state: State) -> Tuple[str, Dict[str, float]]:
         Bias cascade detected + managed
 
     Args:
-        state: Current state dictionary
+        state: Current state dictionary, StateVector or state vector
 
     Returns:
         Tuple of (position_name, position_scores)
     """
-    # Extract key variables
-    dk = state.get("Dunning_Kruger", 0.3)
-    oc = state.get("Overconfidence", 0.3)
-    mc = state.get("Meta_Cognition", 0.5)
-    lu = state.get("Lucidity", 1.0)
-    ro = state.get("Recursive_Overthinking", 0.0)
-    eo = state.get("Ego_Oscillation", 0.0)
-    bias_cascade = compute_composite("bias_cascade", state)
-
-    # Position 1: Epistemic Arrogance
-    pos1_score = (
-        0.4 * (dk + oc) / 2.0 +  # High Dunning-Kruger + Overconfidence
-        0.3 * (1.0 - mc) +        # Low Meta-Cognition
-        0.3 * (1.0 - lu)          # Low Lucidity
+    if isinstance(state, (np.ndarray, StateVector)):
+        code, scores = classify_triangle_vec(_as_vec(state))
+        return _POSITION_NAMES[code], dict(zip(_POSITION_KEYS, scores))
+
+    get = state.get
+    scores = _position_scores(
+        get("Dunning_Kruger", 0.3),
+        get("Overconfidence", 0.3),
+        get("Meta_Cognition", 0.5),
+        get("Lucidity", 1.0),
+        get("Recursive_Overthinking", 0.0),
+        get("Ego_Oscillation", 0.0),
+        compute_composite("bias_cascade", state),
     )
+    code = scores.index(max(scores))
+    return _POSITION_NAMES[code], dict(zip(_POSITION_KEYS, scores))
 
-    # Position 2: Meta-Awareness Trap
-    pos2_score = (
-        0.3 * mc +                # High Meta-Cognition
-        0.3 * lu +                # High Lucidity
-        0.2 * ro +                # High Recursive Overthinking
-        0.2 * bias_cascade        # Aware but struggling with biases
-    )
+def classify_triangle_position_batch(Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Classify many states at once (vectorized `classify_triangle_position`).
 
-    # Position 3: Integrated Competence
-    pos3_score = (
-        0.3 * mc +                # High Meta-Cognition
-        0.3 * lu +                # High Lucidity
-        0.2 * (1.0 - ro) +        # Low Recursive Overthinking
-        0.2 * (1.0 - eo)          # Low Ego Oscillation
-    )
-
-    scores = {
-        "Position_1_Epistemic_Arrogance": pos1_score,
-        "Position_2_Meta_Awareness_Trap": pos2_score,
-        "Position_3_Integrated_Competence": pos3_score
-    }
-
-    # Classify to position with highest score
-    max_pos = max(scores, key=scores.get)
-    position_name = max_pos.replace("_", " ")
+    Args:
+        Y: State matrix [N, len(_STATE_KEYS)], one state vector per row
 
-    return position_name, scores
+    Returns:
+        (codes, scores) tuple where:
+            codes: Winning position per row [N], index into _POSITION_NAMES
+            scores: Position scores [N, 3] in _POSITION_KEYS order
+    """
+    Y = np.atleast_2d(np.asarray(Y, dtype=np.float64))
+    scores = Y @ _POSITION_WEIGHTS.T + _POS_CONST
+    return np.argmax(scores, axis=1), scores
+
+# Per-position recommendation blocks (constant, shared across calls)
+_REC_POS1: Tuple[str, ...] = (
+    "1. Scientific Method Training",
+    "   - Focus on base rates and cause-absent evidence",
+    "   - Evidence: d ≈ 1.0, lasts 6+ months",
+    "   - Target: Build awareness of biases",
+    "2. Cognitive Debiasing Training",
+    "   - Mnemonics and Bayesian tools",
+    "   - Awareness of cognitive pitfalls",
+    "   - Evidence: Significant error reduction (p < .001)",
+)
+_REC_POS2: Tuple[str, ...] = (
+    "1. Metacognitive Monitoring Practice",
+    "   - Ongoing self-correction exercises",
+    "   - Real-life applicability training",
+    "   - Evidence: Sustained improvement with practice",
+    "2. Reduce Recursive Overthinking",
+    "   - Structured problem-solving frameworks",
+    "   - Set limits on rumination cycles",
+)
+_REC_POS3: Tuple[str, ...] = (
+    "1. Maintenance Practice",
+    "   - Regular bias calibration exercises",
+    "   - Position 3 is unstable - practice prevents regression",
+    "2. Monitor Ego Oscillation",
+    "   - Maintain stable self-coherence",
+    "   - Regular reality-testing check-ins",
+)
 
 def recommend_debiasing(position: str, state: State) -> List[str]:
     """Recommend debiasing interventions based on triangle position.
@@ -219,46 +592,14 @@ def recommend_debiasing(position: str, state: State) -> List[str]:
     Returns:
         List of intervention recommendations
     """
-    recommendations = []
-
+    selected = []
     if "Position_1" in position or "Epistemic Arrogance" in position:
-        recommendations.extend([
-            "1. Scientific Method Training",
-            "   - Focus on base rates and cause-absent evidence",
-            "   - Evidence: d ≈ 1.0, lasts 6+ months",
-            "   - Target: Build awareness of biases"
-        ])
-        recommendations.extend([
-            "2. Cognitive Debiasing Training",
-            "   - Mnemonics and Bayesian tools",
-            "   - Awareness of cognitive pitfalls",
-            "   - Evidence: Significant error reduction (p < .001)"
-        ])
-
+        selected.append(_REC_POS1)
     if "Position_2" in position or "Meta Awareness" in position:
-        recommendations.extend([
-            "1. Metacognitive Monitoring Practice",
-            "   - Ongoing self-correction exercises",
-            "   - Real-life applicability training",
-            "   - Evidence: Sustained improvement with practice"
-        ])
-        recommendations.extend([
-            "2. Reduce Recursive Overthinking",
-            "   - Structured problem-solving frameworks",
-            "   - Set limits on rumination cycles"
-        ])
-
+        selected.append(_REC_POS2)
     if "Position_3" in position or "Integrated Competence" in position:
-        recommendations.extend([
-            "1. Maintenance Practice",
-            "   - Regular bias calibration exercises",
-            "   - Position 3 is unstable - practice prevents regression"
-        ])
-        recommendations.extend([
-            "2. Monitor Ego Oscillation",
-            "   - Maintain stable self-coherence",
-            "   - Regular reality-testing check-ins"
-        ])
+        selected.append(_REC_POS3)
+    recommendations = list(chain.from_iterable(selected))
 
     # Cross-cutting recommendations
     bias_cascade = compute_composite("bias_cascade", state)
@@ -269,11 +610,14 @@ def recommend_debiasing(position: str, state: State) -> List[str]:
 
     return recommendations
 
-def detect_flags(state: State, thresholds: Optional[Dict] = None) -> Dict[str, bool]:
+def detect_flags(
+    state: Union[State, StateVector, np.ndarray],
+    thresholds: Optional[Dict] = None
+) -> Dict[str, bool]:
     """Pattern detection with parametrized thresholds.
 
     Args:
-        state: Current state dictionary
+        state: Current state dictionary, StateVector or state vector
         thresholds: Optional custom thresholds (default uses empirical values)
 
     Returns:
@@ -289,25 +633,34 @@ def detect_flags(state: State, thresholds: Optional[Dict] = None) -> Dict[str, b
             'narrative_collapse': 0.7
         }
 
-    # Bias Cascade
-    bias_cluster = compute_composite("bias_cascade", state)
+    if isinstance(state, (np.ndarray, StateVector)):
+        x = _as_vec(state).tolist()
+        bias_cluster = _bias_cascade_list(x)
+        coherence, continuity, arc = x[_I_COHERENCE], x[_I_CONTINUITY], x[_I_ARC]
+        delusionality, dogma, protagonist = x[_I_DELUSIONALITY], x[_I_DOGMA], x[_I_PROTAGONIST]
+    else:
+        # Dictionary: composite reads missing keys as 0.0, sliders use defaults
+        get = state.get
+        bias_cluster = compute_composite("bias_cascade", state)
+        coherence = get("Coherence", 0.7)
+        continuity = get("Continuity", 0.7)
+        arc = get("Arc", 0.5)
+        delusionality = get("Delusionality", 0.0)
+        dogma = get("Dogma_Fixation", 0.0)
+        protagonist = get("Protagonist", 0.6)
 
     # Narrative Collapse
-    narrative_risk = 1.0 - (
-        0.4 * state.get("Coherence", 0.7) +
-        0.3 * state.get("Continuity", 0.7) +
-        0.3 * state.get("Arc", 0.5)
-    )
+    narrative_risk = 1.0 - (0.4 * coherence + 0.3 * continuity + 0.3 * arc)
 
     return {
-        "Bias_Cascade": (
+        "Bias_Cascade": bool(
             bias_cluster > thresholds['bias_cluster'] and
-            state.get("Delusionality", 0.0) > thresholds['delusionality']
+            delusionality > thresholds['delusionality']
         ),
-        "Narrative_Collapse": narrative_risk > thresholds['narrative_collapse'],
-        "Moral_Rigidity": (
-            state.get("Dogma_Fixation", 0.0) > thresholds['dogma'] and
-            state.get("Protagonist", 0.6) > 0.7
+        "Narrative_Collapse": bool(narrative_risk > thresholds['narrative_collapse']),
+        "Moral_Rigidity": bool(
+            dogma > thresholds['dogma'] and
+            protagonist > 0.7
         ),
     }
 
@@ -315,80 +668,258 @@ def detect_flags(state: State, thresholds: Optional[Dict] = None) -> Dict[str, b
 # 4. Dynamics (ODE Integration)
 # ===========================================================================
 
-def derivatives(t: float, y: np.ndarray, state_keys: List[str]) -> np.ndarray:
-    """Derivative function for ODE integration.
+# Slots of the index vector handed to _rhs_kernel (-1 = variable absent)
+_RHS_INDEX_KEYS: Tuple[str, ...] = (
+    "Fear", "Joy", "Ego_Oscillation", "Lucidity",
+    "Recursive_Overthinking", "Meta_Cognition", "Confirmation",
+)
 
-    Implements simple decay/growth dynamics for demonstration.
-    Extend with additional dynamics as needed.
+@njit("void(float64, float64[:], float64[:], float64[:], int64[:], float64[:])",
+      cache=True, fastmath=True)
+def _rhs_into(t, y, w_pos, w_bias, idx, dy):
+    """Compiled ODE right-hand side, written into a caller-owned buffer.
+
+    Every entry of `dy` is assigned, so the buffer may come from np.empty
+    and be reused across calls.
 
     Args:
         t: Time point
         y: State vector (flat array)
-        state_keys: Ordered list of state variable names
-
-    Returns:
-        Derivative vector dy/dt
+        w_pos: 'positive' composite weights aligned with y
+        w_bias: 'bias_cascade' composite weights aligned with y
+        idx: Positions of _RHS_INDEX_KEYS in y (-1 if absent)
+        dy: Output derivative vector dy/dt, same shape as y
     """
-    # Reconstruct state dictionary
-    state = dict(zip(state_keys, y))
-
-    # Compute derivatives
-    dy = np.zeros_like(y)
-    state_dict = {k: v for k, v in zip(state_keys, y)}
+    i_fear, i_joy, i_ego, i_luc = idx[0], idx[1], idx[2], idx[3]
+    i_ro, i_mc, i_conf = idx[4], idx[5], idx[6]
 
-    # Example dynamics (extend as needed)
-    idx = {k: i for i, k in enumerate(state_keys)}
+    # One pass over y: clear dy and accumulate both composites
+    pos = 0.0
+    bias = 0.0
+    for j in range(y.shape[0]):
+        dy[j] = 0.0
+        pos += w_pos[j] * y[j]
+        bias += w_bias[j] * y[j]
 
     # Fear decays slowly
-    if "Fear" in idx:
-        dy[idx["Fear"]] = -0.1 * state_dict["Fear"]
+    if i_fear >= 0:
+        dy[i_fear] = -0.1 * y[i_fear]
 
     # Joy integrates positive composite
-    if "Joy" in idx:
-        pos = compute_composite("positive", state_dict)
-        dy[idx["Joy"]] = 0.05 * pos - 0.02 * state_dict["Joy"]
+    if i_joy >= 0:
+        dy[i_joy] = 0.05 * pos - 0.02 * y[i_joy]
 
     # Ego oscillation damped by Lucidity
-    if "Ego_Oscillation" in idx and "Lucidity" in idx:
-        dy[idx["Ego_Oscillation"]] = (
-            0.1 * state_dict.get("Recursive_Overthinking", 0.0) -
-            0.05 * state_dict["Lucidity"]
-        )
+    if i_ego >= 0 and i_luc >= 0:
+        ro = y[i_ro] if i_ro >= 0 else 0.0
+        dy[i_ego] = 0.1 * ro - 0.05 * y[i_luc]
 
     # Meta-cognition reduces bias cascade
-    if "Meta_Cognition" in idx and "Confirmation" in idx:
-        bias_awareness = state_dict["Meta_Cognition"] * (1 - compute_composite("bias_cascade", state_dict))
-        dy[idx["Meta_Cognition"]] = 0.1 * bias_awareness
-        dy[idx["Confirmation"]] = -0.05 * bias_awareness
+    if i_mc >= 0 and i_conf >= 0:
+        bias_awareness = y[i_mc] * (1 - bias)
+        dy[i_mc] = 0.1 * bias_awareness
+        dy[i_conf] = -0.05 * bias_awareness
+
+@njit("float64[:](float64, float64[:], float64[:], float64[:], int64[:])",
+      cache=True, fastmath=True)
+def _rhs_kernel(t, y, w_pos, w_bias, idx):
+    """Compiled ODE right-hand side on a flat state vector.
 
+    Allocating wrapper around `_rhs_into` for callers (solve_ivp) that
+    expect a fresh derivative array.
+
+    Args:
+        t: Time point
+        y: State vector (flat array)
+        w_pos: 'positive' composite weights aligned with y
+        w_bias: 'bias_cascade' composite weights aligned with y
+        idx: Positions of _RHS_INDEX_KEYS in y (-1 if absent)
+
+    Returns:
+        Derivative vector dy/dt
+    """
+    dy = np.empty_like(y)
+    _rhs_into(t, y, w_pos, w_bias, idx, dy)
     return dy
 
+def _rhs_args(state_keys: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Resolve the constant arrays `_rhs_kernel` needs for a key ordering.
+
+    Args:
+        state_keys: Ordered list of state variable names
+
+    Returns:
+        (w_pos, w_bias, idx) tuple aligned with `state_keys`
+    """
+    idx = {k: i for i, k in enumerate(state_keys)}
+    keys = tuple(state_keys)
+    w_pos = _weights_to_array(WEIGHTS["positive"], keys)
+    w_bias = _weights_to_array(WEIGHTS["bias_cascade"], keys)
+    idx_arr = np.array([idx.get(k, -1) for k in _RHS_INDEX_KEYS], dtype=np.int64)
+    return w_pos, w_bias, idx_arr
+
+# Kernel arguments for the canonical layout (what simulate_trajectory uses)
+_RHS_ARGS = _rhs_args(_STATE_KEYS)
+_RK4_SUBSTEPS = 4
+
+def _make_rhs(state_keys: List[str]):
+    """Build the ODE right-hand side for a fixed state-key ordering.
+
+    All key→index resolution and composite weight alignment happens here,
+    once, so the returned closure only forwards arrays to `_rhs_kernel`.
+
+    Args:
+        state_keys: Ordered list of state variable names
+
+    Returns:
+        Callable rhs(t, y) -> dy/dt
+    """
+    w_pos, w_bias, idx_arr = _rhs_args(state_keys)
+
+    def rhs(t: float, y: np.ndarray) -> np.ndarray:
+        return _rhs_kernel(t, y, w_pos, w_bias, idx_arr)
+
+    return rhs
+
+@njit("Tuple((float64[:], float64[::1, :]))"
+      "(float64[:], float64[:], float64[:], float64[:], int64[:], int64)",
+      cache=True, fastmath=True)
+def rk4_integrate(y0, t_eval, w_pos, w_bias, idx, substeps):
+    """Fixed-step classical Runge-Kutta integration of `_rhs_into`.
+
+    The RHS is small and non-stiff, so RK4 with a few substeps per output
+    interval matches the adaptive scipy solvers without any Python
+    callbacks.
+
+    Args:
+        y0: Initial state vector
+        t_eval: Output time points (increasing)
+        w_pos: 'positive' composite weights aligned with y0
+        w_bias: 'bias_cascade' composite weights aligned with y0
+        idx: Positions of _RHS_INDEX_KEYS in y0 (-1 if absent)
+        substeps: RK4 steps taken per output interval
+
+    Returns:
+        (t_eval, y_sol) tuple with y_sol shaped [n_vars, n_points]
+
+    Raises:
+        ValueError: If the weights or idx do not fit y0
+    """
+    n_points, n = t_eval.shape[0], y0.shape[0]
+    if w_pos.shape[0] != n or w_bias.shape[0] != n:
+        raise ValueError("weight arrays must match the length of y0")
+    for k in idx:
+        if k >= n:
+            raise ValueError("idx points past the end of y0")
+    y = np.empty((n_points, n))
+    if n_points == 0:
+        return t_eval, y.T
+    y[0] = y0
+
+    # Scratch buffers reused by every RHS evaluation
+    yi = y0.copy()
+    ytmp = np.empty(n)
+    k1, k2, k3, k4 = np.empty(n), np.empty(n), np.empty(n), np.empty(n)
+
+    for i in range(n_points - 1):
+        h = (t_eval[i + 1] - t_eval[i]) / substeps
+        t = t_eval[i]
+        for _ in range(substeps):
+            _rhs_into(t, yi, w_pos, w_bias, idx, k1)
+            for j in range(n):
+                ytmp[j] = yi[j] + 0.5 * h * k1[j]
+            _rhs_into(t + 0.5 * h, ytmp, w_pos, w_bias, idx, k2)
+            for j in range(n):
+                ytmp[j] = yi[j] + 0.5 * h * k2[j]
+            _rhs_into(t + 0.5 * h, ytmp, w_pos, w_bias, idx, k3)
+            for j in range(n):
+                ytmp[j] = yi[j] + h * k3[j]
+            _rhs_into(t + h, ytmp, w_pos, w_bias, idx, k4)
+            for j in range(n):
+                yi[j] += h / 6.0 * (k1[j] + 2.0 * k2[j] + 2.0 * k3[j] + k4[j])
+            t += h
+        y[i + 1] = yi
+    return t_eval, y.T
+
+def derivatives(t: float, y: np.ndarray, state_keys: List[str]) -> np.ndarray:
+    """Derivative function for ODE integration.
+
+    Implements simple decay/growth dynamics for demonstration.
+    Extend with additional dynamics in `_make_rhs`. Convenience wrapper for
+    one-off evaluations; integrators should build the RHS once with
+    `_make_rhs` instead of calling this per step.
+
+    Args:
+        t: Time point
+        y: State vector (flat array)
+        state_keys: Ordered list of state variable names
+
+    Returns:
+        Derivative vector dy/dt
+    """
+    y = np.asarray(y, dtype=np.float64)
+    if y.shape != (len(state_keys),):
+        raise ValueError(f"Expected a state vector of shape ({len(state_keys)},), got {y.shape}")
+    return _make_rhs(state_keys)(t, y)
+
 def simulate_trajectory(
-    state: State,
+    state: Union[State, StateVector, np.ndarray],
     t_span: Tuple[float, float] = (0, 10),
     n_points: int = 100,
-    method: str = 'RK45'
+    method: Optional[str] = None
 ) -> Tuple[np.ndarray, np.ndarray]:
-    """Simulate state trajectory using scipy.integrate.solve_ivp.
+    """Simulate state trajectory.
+
+    'RK4' runs the compiled fixed-step integrator (`rk4_integrate`); any
+    other method is forwarded to scipy.integrate.solve_ivp. The default is
+    'RK4' when numba is installed and 'RK45' otherwise, since uncompiled
+    RK4 is a pure-Python loop.
+
+    The state is always integrated in the full STATE_KEYS layout. Variables
+    a dictionary leaves out are filled as in `state_to_vec` and take no part
+    in the dynamics, so the supplied variables evolve exactly as if only
+    they had been integrated; the filled rows stay constant.
 
     Args:
-        state: Initial state dictionary
+        state: Initial state dictionary, StateVector or state vector
         t_span: Time interval (t_start, t_end)
         n_points: Number of evaluation points
-        method: Integration method ('RK45', 'RK23', 'DOP853', 'Radau', 'BDF', 'LSODA')
+        method: Integration method ('RK4', 'RK45', 'RK23', 'DOP853', 'Radau', 'BDF', 'LSODA');
+            None picks the default described above
 
     Returns:
         (t_eval, y_sol) tuple where:
             t_eval: Time points [n_points]
-            y_sol: State trajectories [n_vars, n_points]
+            y_sol: State trajectories [n_vars, n_points], rows in STATE_KEYS order
+
+    Raises:
+        ValueError: If a state vector is not of shape (NUM_SLIDERS,), or a
+            dictionary holds variables outside STATE_KEYS
     """
-    state_keys = sorted(state.keys())  # Consistent ordering
-    y0 = np.array([state[k] for k in state_keys])
+    y0 = np.array(_as_vec(state), dtype=np.float64)
+    # The compiled kernels index y0 through the fixed _RHS_ARGS tables unchecked
+    if y0.shape != (NUM_SLIDERS,):
+        raise ValueError(f"Expected a state vector of shape ({NUM_SLIDERS},), got {y0.shape}")
+
+    rhs_args = _RHS_ARGS
+    if not isinstance(state, (np.ndarray, StateVector)):
+        unknown = state.keys() - _KEY_INDEX.keys()
+        if unknown:
+            raise ValueError(f"Unknown state variables: {sorted(unknown)}")
+        # Dynamics only drive (and read) the variables the caller supplied
+        w_pos, w_bias, idx = _RHS_ARGS
+        present = np.array([k in state for k in _RHS_INDEX_KEYS])
+        rhs_args = (w_pos, w_bias, np.where(present, idx, -1))
 
     t_eval = np.linspace(t_span[0], t_span[1], n_points)
 
+    if method is None:
+        method = 'RK4' if _HAVE_NUMBA else 'RK45'
+    if method == 'RK4':
+        return rk4_integrate(y0, t_eval, *rhs_args, _RK4_SUBSTEPS)
+
     solution = solve_ivp(
-        fun=lambda t, y: derivatives(t, y, state_keys),
+        fun=lambda t, y: _rhs_kernel(t, y, *rhs_args),
         t_span=t_span,
         y0=y0,
         method=method,
@@ -405,50 +936,49 @@ def simulate_trajectory(
 # 5. Demonstration
 # ===========================================================================
 
-if __name__ == "__main__":
+if __name__ == "__main__" and PHARMAKON_VERBOSE:
     print("=" * 80)
     print("PHARMAKON v10.0 – Bias Detector")
     print("=" * 80)
     print()
 
     # Initialize state with acute stress pattern
-    state: State = {
-        **asdict(BodySliders(
+    state = StateBuilder.from_sliders(
+        BodySliders(
             Sympathetic_Surge=0.9,
             Motor_Rigidity=0.7,
             Thermal_Overload=0.8,
             Cortisol=0.6,
             Heart_Rate=0.8
-        )),
-        **asdict(AffectSliders(
+        ),
+        AffectSliders(
             Fear=0.8,
             Joy=0.1,
             Anger=0.5
-        )),
-        **asdict(CognitiveSliders(
+        ),
+        CognitiveSliders(
             Recursive_Overthinking=0.8,
             Ego_Oscillation=0.7,
             Lucidity=0.8,
             Meta_Cognition=0.6
-        )),
-        **asdict(BiasSliders(
+        ),
+        BiasSliders(
             Confirmation=0.7,
             Dunning_Kruger=0.6,
             Overconfidence=0.7,
             Negativity=0.8
-        )),
-        **asdict(NarrativeSliders(
+        ),
+        NarrativeSliders(
             Coherence=0.4,
             Continuity=0.5,
             Arc=0.3
-        )),
-        "Dogma_Fixation": 0.2,
-        "Delusionality": 0.3,
-    }
+        ),
+        delusionality=0.3,
+        dogma_fixation=0.2,
+    )
 
     print("📊 Initial Composites:")
-    for comp in ["stress", "positive", "bias_cascade"]:
-        val = compute_composite(comp, state)
+    for comp, val in compute_composites(state).items():
         print(f"  {comp:15s}: {val:.3f}")
     print()
 
@@ -478,7 +1008,7 @@ if __name__ == "__main__":
         t, y = simulate_trajectory(state, t_span=(0, 10), n_points=10)
         print(f"  ✓ Integration successful ({len(t)} points)")
         # For demonstration: print initial and final value for one variable
-        fear_index = sorted(state.keys()).index('Fear')
+        fear_index = SliderIndex.Fear
         print(f"  Fear trajectory: [{y[fear_index, 0]:.3f}, {y[fear_index, -1]:.3f}]")
     except Exception as e:
         print(f"  ✗ Integration failed: {e}")
@@ -19,16 +19,59 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from contextlib import redirect_stdout
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+import io
 import json
+import os
+import struct
+import sys
 from pathlib import Path
+import numpy as np
+
+if __name__ == "__main__":
+    # numba's disk cache records kernels under their module name; alias the
+    # script so caches written by `import PHARMAKON_v0_1` users still load.
+    sys.modules.setdefault("PHARMAKON_v0_1", sys.modules[__name__])
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; kernels then run as plain Python
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+    prange = range
+
+# Pretty-printing switch: PHARMAKON_VERBOSE=0 silences the demo and the
+# description echo of create_state / create_refined_state
+PHARMAKON_VERBOSE = os.environ.get("PHARMAKON_VERBOSE", "1") == "1"
 
 # ===========================================================================
 # 1. Minimal State: Three Orthogonal Dimensions
 # ===========================================================================
 
-@dataclass
+def _construct_clipped(cls, arr) -> list:
+    """Instantiate `cls` once per row of an [N, n_fields] array, clamping to [0, 1].
+
+    The whole batch is clamped with a single np.clip, with NaN mapped to 1.0
+    as the scalar clamp in __post_init__ does, so every row reaches the
+    constructor as in-range Python floats and __post_init__ has nothing to do.
+    """
+    n_fields = len(fields(cls))
+    rows = np.asarray(arr, dtype=np.float64)
+    if rows.ndim != 2 or rows.shape[1] != n_fields:
+        raise ValueError(f"Expected an [N, {n_fields}] array, got shape {rows.shape}")
+    rows = np.clip(rows, 0.0, 1.0)
+    rows[np.isnan(rows)] = 1.0
+    return [cls(*row) for row in rows.tolist()]
+
+@dataclass(slots=True, frozen=True)
 class MinimalState:
     """Minimal sufficient statistic - three orthogonal dimensions.
     
@@ -52,12 +95,60 @@ class MinimalState:
     B: float = 0.4    # Bias/Knowing (0=accurate, 1=delusional)
 
     def __post_init__(self):
-        """Validate ranges [0, 1]."""
-        self.S = max(0.0, min(1.0, self.S))
-        self.H = max(0.0, min(1.0, self.H))
-        self.B = max(0.0, min(1.0, self.B))
+        """Validate ranges [0, 1] (in-range floats are left untouched)."""
+        S, H, B = self.S, self.H, self.B
+        if not (type(S) is float and type(H) is float and type(B) is float
+                and 0.0 <= S <= 1.0 and 0.0 <= H <= 1.0 and 0.0 <= B <= 1.0):
+            object.__setattr__(self, 'S', max(0.0, min(1.0, S)))
+            object.__setattr__(self, 'H', max(0.0, min(1.0, H)))
+            object.__setattr__(self, 'B', max(0.0, min(1.0, B)))
+
+    @classmethod
+    def from_array(cls, arr) -> "MinimalState":
+        """Build from an [S, H, B] array, clamping with one np.clip call."""
+        arr = np.asarray(arr, dtype=np.float64)
+        if arr.shape != (3,):
+            raise ValueError(f"Expected an [S, H, B] array of shape (3,), got {arr.shape}")
+        return _construct_clipped(cls, arr[np.newaxis])[0]
+
+    @classmethod
+    def batch_from_array(cls, arr) -> List["MinimalState"]:
+        """Build one state per row of an [N, 3] array of (S, H, B)."""
+        return _construct_clipped(cls, arr)
+
+@njit("float64(float64, float64, float64, float64)", cache=True)
+def _amplification_kernel(S, H_somatic, H_cognitive, B):
+    """Arithmetic of `RefinedState.bias_amplification`."""
+    if H_cognitive < 0.3:
+        # Cognitive capacity critically low - bias amplifies dramatically
+        # Amplification factor: somatic/cognitive ratio × identity vulnerability
+        amplification = (H_somatic / max(H_cognitive, 0.1)) * (1 - S)
+        # Cap amplification at reasonable maximum (3x baseline)
+        return min(B * amplification, 1.0)
+    # Linear combination otherwise (both energies balanced)
+    return B
+
+@njit("float64(float64, float64)", cache=True)
+def _mismatch_kernel(H_somatic, H_cognitive):
+    """Arithmetic of `RefinedState.energy_mismatch`."""
+    return max(0.0, H_somatic - H_cognitive)
+
+@njit("UniTuple(float64, 2)(float64, float64, float64, float64)", cache=True)
+def amplify(S, H_somatic, H_cognitive, B):
+    """Amplified bias and energy mismatch of a refined state in one native call.
 
-@dataclass
+    Args:
+        S, H_somatic, H_cognitive, B: RefinedState values
+
+    Returns:
+        (amplified_bias, energy_mismatch) tuple, both in [0, 1]
+    """
+    return (
+        _amplification_kernel(S, H_somatic, H_cognitive, B),
+        _mismatch_kernel(H_somatic, H_cognitive),
+    )
+
+@dataclass(slots=True, frozen=True)
 class RefinedState:
     """Refined 4-variable state: Separates somatic and cognitive energy.
     
@@ -87,11 +178,29 @@ class RefinedState:
     B: float = 0.4              # Bias baseline
 
     def __post_init__(self):
-        """Validate ranges [0, 1]."""
-        self.S = max(0.0, min(1.0, self.S))
-        self.H_somatic = max(0.0, min(1.0, self.H_somatic))
-        self.H_cognitive = max(0.0, min(1.0, self.H_cognitive))
-        self.B = max(0.0, min(1.0, self.B))
+        """Validate ranges [0, 1] (in-range floats are left untouched)."""
+        S, Hs, Hc, B = self.S, self.H_somatic, self.H_cognitive, self.B
+        if not (type(S) is float and type(Hs) is float and type(Hc) is float and type(B) is float
+                and 0.0 <= S <= 1.0 and 0.0 <= Hs <= 1.0 and 0.0 <= Hc <= 1.0 and 0.0 <= B <= 1.0):
+            object.__setattr__(self, 'S', max(0.0, min(1.0, S)))
+            object.__setattr__(self, 'H_somatic', max(0.0, min(1.0, Hs)))
+            object.__setattr__(self, 'H_cognitive', max(0.0, min(1.0, Hc)))
+            object.__setattr__(self, 'B', max(0.0, min(1.0, B)))
+
+    @classmethod
+    def from_array(cls, arr) -> "RefinedState":
+        """Build from an [S, H_somatic, H_cognitive, B] array, clamping with one np.clip call."""
+        arr = np.asarray(arr, dtype=np.float64)
+        if arr.shape != (4,):
+            raise ValueError(
+                f"Expected an [S, H_somatic, H_cognitive, B] array of shape (4,), got {arr.shape}"
+            )
+        return _construct_clipped(cls, arr[np.newaxis])[0]
+
+    @classmethod
+    def batch_from_array(cls, arr) -> List["RefinedState"]:
+        """Build one state per row of an [N, 4] array of (S, H_somatic, H_cognitive, B)."""
+        return _construct_clipped(cls, arr)
 
     def bias_amplification(self) -> float:
         """Compute bias amplification based on somatic/cognitive mismatch.
@@ -103,15 +212,29 @@ class RefinedState:
         Returns:
             Amplified bias value [0, 1]
         """
-        if self.H_cognitive < 0.3:
-            # Cognitive capacity critically low - bias amplifies dramatically
-            # Amplification factor: somatic/cognitive ratio × identity vulnerability
-            amplification = (self.H_somatic / max(self.H_cognitive, 0.1)) * (1 - self.S)
-            # Cap amplification at reasonable maximum (3x baseline)
-            amplified_bias = min(self.B * amplification, 1.0)
-            return amplified_bias
-        # Linear combination otherwise (both energies balanced)
-        return self.B
+        return _amplification_kernel(self.S, self.H_somatic, self.H_cognitive, self.B)
+
+    @staticmethod
+    def bias_amplification_vec(
+        S: np.ndarray,
+        H_somatic: np.ndarray,
+        H_cognitive: np.ndarray,
+        B: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized `bias_amplification` over arrays of states.
+
+        Branch-free: both branches are evaluated and selected with np.where.
+        Scalar callers should keep using the method; array dispatch costs more
+        than the arithmetic for a single state.
+
+        Returns:
+            Amplified bias values [0, 1], broadcast shape of the inputs
+        """
+        S, H_somatic, H_cognitive, B = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (S, H_somatic, H_cognitive, B))
+        )
+        amplification = (H_somatic / np.maximum(H_cognitive, 0.1)) * (1 - S)
+        return np.where(H_cognitive < 0.3, np.minimum(B * amplification, 1.0), B)
     
     def energy_mismatch(self) -> float:
         """Compute somatic-cognitive energy mismatch.
@@ -119,12 +242,63 @@ class RefinedState:
         Returns:
             Mismatch value [0, 1] where 1 = maximum mismatch (H_somatic high, H_cognitive low)
         """
-        return max(0.0, self.H_somatic - self.H_cognitive)
+        return _mismatch_kernel(self.H_somatic, self.H_cognitive)
 
 # ===========================================================================
 # 2. Refined State Classification
 # ===========================================================================
 
+# Refined position codes returned by _refined_code (index into both tuples)
+_REFINED_POSITIONS: Tuple[str, ...] = (
+    "Ego_Dissolution",
+    "Cognitive_Collapse",
+    "Stress_Amplification",
+    "Position_1_Epistemic_Arrogance",
+    "Position_3_Integrated_Competence",
+    "Position_2_Meta_Awareness_Trap",
+    "Transitional_State",
+)
+_REFINED_DESCRIPTIONS: Tuple[str, ...] = (
+    "S → 0: Identity dissolution. Bias becomes meaningless - no self to be biased.",
+    "H_cognitive → 0: Executive function collapsed. Bias amplified to {B:.2f}. Physical arousal ({H_somatic:.2f}) outpacing cognition.",
+    "H_somatic ({H_somatic:.2f}) >> H_cognitive ({H_cognitive:.2f}): Physical arousal outpaces cognition. Bias amplified to {B:.2f}.",
+    "Strong identity + High energy + High amplified bias ({B:.2f}). Confident but wrong.",
+    "Strong identity + Balanced energies + Low bias ({B:.2f}). Calibrated awareness.",
+    "Strong identity + Moderate amplified bias ({B:.2f}). Aware but struggling.",
+    "Mixed profile: S={S:.2f}, H_somatic={H_somatic:.2f}, H_cognitive={H_cognitive:.2f}, B_amplified={B:.2f}.",
+)
+
+@njit("int64(float64, float64, float64, float64, float64)", cache=True)
+def _refined_code(S, H_somatic, H_cognitive, B, mismatch):
+    """Decision tree of `classify_refined_position` as an integer code.
+
+    Args:
+        S, H_somatic, H_cognitive: RefinedState values
+        B: Amplified bias
+        mismatch: Somatic-cognitive energy mismatch
+
+    Returns:
+        Index into _REFINED_POSITIONS / _REFINED_DESCRIPTIONS
+    """
+    # Special cases: Ego dissolution, cognitive collapse, stress response
+    if S < 0.2:
+        return 0
+    if H_cognitive < 0.2:
+        return 1
+    if mismatch > 0.4:
+        return 2
+    # Position 1: Epistemic Arrogance (high S, high energies, high amplified bias)
+    if S > 0.7 and (H_somatic > 0.6 or H_cognitive > 0.6) and B > 0.6:
+        return 3
+    # Position 3: Integrated Competence (high S, balanced energies, low bias)
+    if S > 0.7 and abs(H_somatic - H_cognitive) < 0.2 and B < 0.4:
+        return 4
+    # Position 2: Meta-Awareness Trap (aware but struggling)
+    if S > 0.5 and B > 0.4 and B < 0.7:
+        return 5
+    # Transitional/Mixed state
+    return 6
+
 def classify_refined_position(state: RefinedState) -> Tuple[str, str]:
     """Classify epistemic position based on 4-variable refined model.
     
@@ -140,63 +314,102 @@ def classify_refined_position(state: RefinedState) -> Tuple[str, str]:
     S = state.S
     H_somatic = state.H_somatic
     H_cognitive = state.H_cognitive
-    B = state.bias_amplification()
-    mismatch = state.energy_mismatch()
-    
-    # Special case: Ego dissolution
-    if S < 0.2:
-        return (
-            "Ego_Dissolution",
-            "S → 0: Identity dissolution. Bias becomes meaningless - no self to be biased."
-        )
-    
-    # Special case: Cognitive collapse
-    if H_cognitive < 0.2:
-        return (
-            "Cognitive_Collapse",
-            f"H_cognitive → 0: Executive function collapsed. Bias amplified to {B:.2f}. Physical arousal ({H_somatic:.2f}) outpacing cognition."
-        )
-    
-    # Special case: Somatic-Cognitive Mismatch (stress response)
-    if mismatch > 0.4:
-        return (
-            "Stress_Amplification",
-            f"H_somatic ({H_somatic:.2f}) >> H_cognitive ({H_cognitive:.2f}): Physical arousal outpaces cognition. Bias amplified to {B:.2f}."
-        )
-    
-    # Standard positions using amplified bias
-    # Position 1: Epistemic Arrogance (high S, high energies, high amplified bias)
-    if S > 0.7 and (H_somatic > 0.6 or H_cognitive > 0.6) and B > 0.6:
-        return (
-            "Position_1_Epistemic_Arrogance",
-            f"Strong identity + High energy + High amplified bias ({B:.2f}). Confident but wrong."
-        )
-    
-    # Position 3: Integrated Competence (high S, balanced energies, low bias)
-    if S > 0.7 and abs(H_somatic - H_cognitive) < 0.2 and B < 0.4:
-        return (
-            "Position_3_Integrated_Competence",
-            f"Strong identity + Balanced energies + Low bias ({B:.2f}). Calibrated awareness."
-        )
-    
-    # Position 2: Meta-Awareness Trap (aware but struggling)
-    if S > 0.5 and B > 0.4 and B < 0.7:
-        return (
-            "Position_2_Meta_Awareness_Trap",
-            f"Strong identity + Moderate amplified bias ({B:.2f}). Aware but struggling."
-        )
-    
-    # Transitional/Mixed state
-    return (
-        "Transitional_State",
-        f"Mixed profile: S={S:.2f}, H_somatic={H_somatic:.2f}, H_cognitive={H_cognitive:.2f}, B_amplified={B:.2f}."
+    B, mismatch = amplify(S, H_somatic, H_cognitive, state.B)
+    code = _refined_code(S, H_somatic, H_cognitive, B, mismatch)
+    description = _REFINED_DESCRIPTIONS[code].format(
+        S=S, H_somatic=H_somatic, H_cognitive=H_cognitive, B=B
     )
+    return _REFINED_POSITIONS[code], description
+
+def classify_refined_batch(
+    S: np.ndarray,
+    H_somatic: np.ndarray,
+    H_cognitive: np.ndarray,
+    B: np.ndarray
+) -> np.ndarray:
+    """Vectorized `classify_refined_position` over arrays of refined states.
+
+    Args:
+        S, H_somatic, H_cognitive, B: Equal-length arrays (B is the baseline bias)
+
+    Returns:
+        Position codes [N], index into _REFINED_POSITIONS
+    """
+    S = np.asarray(S, dtype=np.float64)
+    Hs = np.asarray(H_somatic, dtype=np.float64)
+    Hc = np.asarray(H_cognitive, dtype=np.float64)
+    B_amp = RefinedState.bias_amplification_vec(S, Hs, Hc, B)
+    mismatch = np.maximum(0.0, Hs - Hc)
+    conditions = [
+        S < 0.2,
+        Hc < 0.2,
+        mismatch > 0.4,
+        (S > 0.7) & ((Hs > 0.6) | (Hc > 0.6)) & (B_amp > 0.6),
+        (S > 0.7) & (np.abs(Hs - Hc) < 0.2) & (B_amp < 0.4),
+        (S > 0.5) & (B_amp > 0.4) & (B_amp < 0.7),
+    ]
+    return np.select(conditions, range(6), default=6)
 
 # ===========================================================================
 # 3. Triangle Position Classification (MinimalState)
 # ===========================================================================
 
-def classify_position(state: MinimalState) -> Tuple[str, str]:
+# Position codes (index = classifier code), in decision-cascade order
+POSITION_NAMES: Tuple[str, ...] = (
+    "Ego_Dissolution",
+    "Energy_Collapse",
+    "Delusional_Defense",
+    "Position_1_Epistemic_Arrogance",
+    "Position_3_Integrated_Competence",
+    "Position_2_Meta_Awareness_Trap",
+    "Transitional_State",
+)
+
+_POSITION_DESCRIPTIONS: Tuple[str, ...] = (
+    "S → 0: Identity dissolution. Bias (B) becomes meaningless - no self to be biased. Different ontology.",
+    "H → 0: Energy depleted. Both arrogance and competence collapse under stress.",
+    "B → 1: Severe bias. Person's Self (S) now defends a false model of reality.",
+    "Strong identity + High energy + High bias. Confident but wrong. Example: Reddit bride (S=0.85, H=0.75, B=0.85)",
+    "Strong identity + High energy + Low bias. Calibrated awareness.",
+    "Strong identity + Moderate bias. Aware of biases but struggling to manage them.",
+    "Mixed profile: S={S:.2f}, H={H:.2f}, B={B:.2f}. Position unclear - may be in transition.",
+)
+
+@njit("int64(float64, float64, float64)", cache=True)
+def _classify_kernel(S, H, B):
+    """Decision cascade of `classify_position` as an index into POSITION_NAMES."""
+    # Special cases: Ego dissolution, energy collapse, delusional
+    if S < 0.2:
+        return 0
+    if H < 0.2:
+        return 1
+    if B > 0.8:
+        return 2
+    # Position 1: Epistemic Arrogance (high S, high H, high B)
+    if S > 0.7 and H > 0.6 and B > 0.6:
+        return 3
+    # Position 3: Integrated Competence (high S, high H, low B)
+    if S > 0.7 and H > 0.6 and B < 0.4:
+        return 4
+    # Position 2: Meta-Awareness Trap (aware but struggling)
+    if S > 0.5 and B > 0.4 and B < 0.7:
+        return 5
+    # Transitional/Mixed state
+    return 6
+
+def _quantize(S: float, H: float, B: float, digits: Optional[int]) -> Tuple[float, float, float]:
+    """Round (S, H, B) to `digits` decimals so near-identical states share a cache entry."""
+    if digits is None:
+        return S, H, B
+    return round(S, digits), round(H, digits), round(B, digits)
+
+@lru_cache(maxsize=8192)
+def _classify_position_impl(S: float, H: float, B: float) -> Tuple[str, str]:
+    """Memoised (S, H, B) → (position_name, description)."""
+    code = _classify_kernel(S, H, B)
+    return POSITION_NAMES[code], _POSITION_DESCRIPTIONS[code].format(S=S, H=H, B=B)
+
+def classify_position(state: MinimalState, quantize: Optional[int] = None) -> Tuple[str, str]:
     """Classify epistemic position based on 3-variable model.
     
     Position 1 (Epistemic Arrogance):
@@ -220,104 +433,226 @@ def classify_position(state: MinimalState) -> Tuple[str, str]:
         - H → 0: Collapse (both arrogance and competence fail)
         - B → 1: Delusional (S defends false model)
     
+    Results are memoised per (S, H, B), so repeated profiles are a cache hit.
+    
     Args:
         state: MinimalState with S, H, B values
+        quantize: Optional number of decimals (e.g. 3) to round values to
+            before classifying, raising the cache hit rate for continuous inputs
         
     Returns:
         Tuple of (position_name, description)
     """
-    S, H, B = state.S, state.H, state.B
-    
-    # Special case: Ego dissolution
-    if S < 0.2:
-        return (
-            "Ego_Dissolution",
-            "S → 0: Identity dissolution. Bias (B) becomes meaningless - no self to be biased. Different ontology."
-        )
-    
-    # Special case: Energy collapse
-    if H < 0.2:
-        return (
-            "Energy_Collapse",
-            "H → 0: Energy depleted. Both arrogance and competence collapse under stress."
-        )
-    
-    # Special case: Delusional
-    if B > 0.8:
-        return (
-            "Delusional_Defense",
-            "B → 1: Severe bias. Person's Self (S) now defends a false model of reality."
-        )
-    
-    # Standard positions
-    # Position 1: Epistemic Arrogance (high S, high H, high B)
-    if S > 0.7 and H > 0.6 and B > 0.6:
-        return (
-            "Position_1_Epistemic_Arrogance",
-            "Strong identity + High energy + High bias. Confident but wrong. Example: Reddit bride (S=0.85, H=0.75, B=0.85)"
-        )
-    
-    # Position 3: Integrated Competence (high S, high H, low B)
-    if S > 0.7 and H > 0.6 and B < 0.4:
-        return (
-            "Position_3_Integrated_Competence",
-            "Strong identity + High energy + Low bias. Calibrated awareness."
-        )
-    
-    # Position 2: Meta-Awareness Trap (aware but struggling)
-    if S > 0.5 and B > 0.4 and B < 0.7:
-        return (
-            "Position_2_Meta_Awareness_Trap",
-            "Strong identity + Moderate bias. Aware of biases but struggling to manage them."
-        )
-    
-    # Transitional/Mixed state
-    return (
-        "Transitional_State",
-        f"Mixed profile: S={S:.2f}, H={H:.2f}, B={B:.2f}. Position unclear - may be in transition."
-    )
+    return _classify_position_impl(*_quantize(state.S, state.H, state.B, quantize))
 
 # ===========================================================================
 # 4. Nonlinear Dynamics
 # ===========================================================================
 
-def compute_nonlinear_interactions(state: MinimalState) -> Dict[str, float]:
+@njit("UniTuple(float64, 5)(float64, float64, float64)", cache=True)
+def _interactions_kernel(S, H, B):
+    """Arithmetic of `compute_nonlinear_interactions`.
+
+    Returns:
+        (Stability, Arrogance_Risk, Delusional_Defense, Bias_Meaningless, Energy_Stress)
+    """
+    # When S → 0: B becomes meaningless
+    bias_meaningless = 1.0 - S if S < 0.3 else 0.0
+    # When H → 0: Everything collapses
+    energy_stress = 1.0 - H
+    # When B → 1: S defends false model
+    delusional_defense = B * S if B > 0.7 else 0.0
+    # Stability: High S + High H + Low B
+    stability = S * H * (1.0 - B)
+    # Risk: High S + High B (confident wrong)
+    arrogance_risk = S * B
+    return stability, arrogance_risk, delusional_defense, bias_meaningless, energy_stress
+
+class Interactions(NamedTuple):
+    """Nonlinear interaction metrics (floats, or arrays in batch results)."""
+    Stability: float            # High S + High H + Low B
+    Arrogance_Risk: float       # High S + High B (confident wrong)
+    Delusional_Defense: float   # B → 1: S defends false model
+    Bias_Meaningless: float     # S → 0: B becomes meaningless
+    Energy_Stress: float        # H → 0: Everything collapses
+
+@lru_cache(maxsize=8192)
+def _compute_nonlinear_interactions_impl(S: float, H: float, B: float) -> Interactions:
+    """Memoised (S, H, B) → Interactions."""
+    return Interactions(*_interactions_kernel(S, H, B))
+
+def compute_nonlinear_interactions(
+    state: MinimalState,
+    quantize: Optional[int] = None
+) -> Interactions:
     """Compute nonlinear interactions between dimensions.
     
     Captures complexity through structure, not additional variables.
+    Results are memoised per (S, H, B).
     
     Args:
         state: MinimalState with S, H, B values
+        quantize: Optional number of decimals to round values to before computing
         
     Returns:
-        Dictionary of interaction metrics
+        Interactions named tuple (use ._asdict() for a dictionary)
     """
-    S, H, B = state.S, state.H, state.B
-    
-    interactions = {}
-    
-    # When S → 0: B becomes meaningless
-    if S < 0.3:
-        interactions['Bias_Meaningless'] = 1.0 - S
-    else:
-        interactions['Bias_Meaningless'] = 0.0
-    
-    # When H → 0: Everything collapses
-    interactions['Energy_Stress'] = 1.0 - H
-    
-    # When B → 1: S defends false model
-    if B > 0.7:
-        interactions['Delusional_Defense'] = B * S
+    return _compute_nonlinear_interactions_impl(
+        *_quantize(state.S, state.H, state.B, quantize)
+    )
+
+def compute_interactions_batch(S: np.ndarray, H: np.ndarray, B: np.ndarray) -> Interactions:
+    """Vectorized `compute_nonlinear_interactions` over arrays of states.
+
+    Args:
+        S, H, B: Equal-length arrays of MinimalState values
+
+    Returns:
+        Interactions named tuple whose fields are arrays
+    """
+    S = np.asarray(S, dtype=np.float64)
+    H = np.asarray(H, dtype=np.float64)
+    B = np.asarray(B, dtype=np.float64)
+    SB = S * B
+    return Interactions(
+        Stability=S * H * (1.0 - B),
+        Arrogance_Risk=SB,
+        Delusional_Defense=np.where(B > 0.7, SB, 0.0),
+        Bias_Meaningless=np.where(S < 0.3, 1.0 - S, 0.0),
+        Energy_Stress=1.0 - H,
+    )
+
+def _classify_codes(S: np.ndarray, H: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Decision cascade of `classify_position` over float64 arrays."""
+    conditions = [
+        S < 0.2,
+        H < 0.2,
+        B > 0.8,
+        (S > 0.7) & (H > 0.6) & (B > 0.6),
+        (S > 0.7) & (H > 0.6) & (B < 0.4),
+        (S > 0.5) & (B > 0.4) & (B < 0.7),
+    ]
+    return np.select(conditions, range(6), default=6)
+
+@njit("Tuple((int64, float64, float64, float64, float64, float64))(float64, float64, float64)",
+      cache=True)
+def _analyze_kernel(S, H, B):
+    """Position code and interactions of one state in a single pass.
+
+    Fuses `_classify_kernel` and `_interactions_kernel`: S·B is formed once
+    for Arrogance_Risk and Delusional_Defense, and the high-S/high-H test is
+    made once for Positions 1 and 3.
+
+    Returns:
+        (code, Stability, Arrogance_Risk, Delusional_Defense, Bias_Meaningless, Energy_Stress)
+    """
+    sb = S * B
+    strong = S > 0.7 and H > 0.6  # shared by Positions 1 and 3
+
+    stability = S * H * (1.0 - B)
+    delusional_defense = sb if B > 0.7 else 0.0
+    bias_meaningless = 1.0 - S if S < 0.3 else 0.0
+    energy_stress = 1.0 - H
+
+    if S < 0.2:
+        code = 0
+    elif H < 0.2:
+        code = 1
+    elif B > 0.8:
+        code = 2
+    elif strong and B > 0.6:
+        code = 3
+    elif strong and B < 0.4:
+        code = 4
+    elif S > 0.5 and B > 0.4 and B < 0.7:
+        code = 5
     else:
-        interactions['Delusional_Defense'] = 0.0
-    
-    # Stability: High S + High H + Low B
-    interactions['Stability'] = S * H * (1.0 - B)
-    
-    # Risk: High S + High B (confident wrong)
-    interactions['Arrogance_Risk'] = S * B
-    
-    return interactions
+        code = 6
+    return code, stability, sb, delusional_defense, bias_meaningless, energy_stress
+
+@lru_cache(maxsize=8192)
+def _analyze_impl(S: float, H: float, B: float) -> Tuple[str, str, Interactions]:
+    """Memoised (S, H, B) → (position_name, description, Interactions)."""
+    code, *values = _analyze_kernel(S, H, B)
+    description = _POSITION_DESCRIPTIONS[code].format(S=S, H=H, B=B)
+    return POSITION_NAMES[code], description, Interactions(*values)
+
+def analyze(
+    state: MinimalState,
+    quantize: Optional[int] = None
+) -> Tuple[str, str, Interactions]:
+    """Classify a state and compute its interactions in one pass.
+
+    Equivalent to calling `classify_position` and
+    `compute_nonlinear_interactions`, but reads S, H, B once and crosses
+    into compiled code once. Results are memoised per (S, H, B).
+
+    Args:
+        state: MinimalState with S, H, B values
+        quantize: Optional number of decimals to round values to before computing
+
+    Returns:
+        Tuple of (position_name, description, interactions)
+    """
+    return _analyze_impl(*_quantize(state.S, state.H, state.B, quantize))
+
+@njit("void(float64[::1], float64[::1], float64[::1], int64[::1], float64[:, ::1])",
+      parallel=True, cache=True)
+def _analyze_parallel_kernel(S, H, B, codes, out):
+    """Fill `codes` and the [N, 5] interaction columns in one pass over the states."""
+    for i in prange(S.shape[0]):
+        (codes[i], out[i, 0], out[i, 1], out[i, 2], out[i, 3], out[i, 4]) = \
+            _analyze_kernel(S[i], H[i], B[i])
+
+def classify_batch(
+    S: np.ndarray,
+    H: np.ndarray,
+    B: np.ndarray
+) -> Tuple[np.ndarray, Interactions]:
+    """Classify and score many MinimalStates at once.
+
+    Takes the team/population as three arrays (structure of arrays) instead
+    of a list of MinimalState objects. With numba, positions and all five
+    interactions are written by one multithreaded compiled pass
+    (`_analyze_kernel` per state); without it, the decision cascade runs as
+    np.select over whole arrays. Inputs of any float dtype are evaluated in
+    float64 so threshold comparisons match the scalar path.
+
+    Args:
+        S, H, B: Equal-length arrays of MinimalState values
+
+    Returns:
+        (codes, interactions) tuple where:
+            codes: Position per state [N], index into POSITION_NAMES
+            interactions: Interactions named tuple whose fields are arrays
+    """
+    S = np.ascontiguousarray(S, dtype=np.float64)
+    H = np.ascontiguousarray(H, dtype=np.float64)
+    B = np.ascontiguousarray(B, dtype=np.float64)
+    if not S.shape == H.shape == B.shape:
+        raise ValueError(f"S, H, B must have equal shapes, got {S.shape}, {H.shape}, {B.shape}")
+    if not _HAVE_NUMBA or S.ndim != 1:
+        return _classify_codes(S, H, B), compute_interactions_batch(S, H, B)
+    codes = np.empty(S.shape[0], dtype=np.int64)
+    out = np.empty((S.shape[0], len(Interactions._fields)), dtype=np.float64)
+    _analyze_parallel_kernel(S, H, B, codes, out)
+    return codes, Interactions(*out.T)
+
+def _warmup() -> None:
+    """Call every compiled kernel once so first-use costs are paid at import.
+
+    The signatures above are compiled eagerly (and cached on disk); this
+    additionally starts the parallel thread pool and resolves dispatch.
+    """
+    amplify(0.5, 0.8, 0.6, 0.4)
+    _refined_code(0.5, 0.8, 0.6, 0.4, 0.2)
+    _classify_kernel(0.5, 0.8, 0.4)
+    _interactions_kernel(0.5, 0.8, 0.4)
+    probe = np.full(1, 0.5)
+    _analyze_kernel(0.5, 0.8, 0.4)
+    _analyze_parallel_kernel(probe, probe, probe, np.empty(1, dtype=np.int64), np.empty((1, 5)))
+
+_warmup()
 
 # ===========================================================================
 # 5. Manual Parameter Entry
@@ -335,13 +670,13 @@ def create_state(
         S: Self/Identity [0, 1] - 0=ego death, 1=rigid identity
         H: Energy/Body [0, 1] - 0=depleted, 1=abundant
         B: Bias/Knowing [0, 1] - 0=accurate, 1=delusional
-        description: Optional description of this state
+        description: Optional description, printed when PHARMAKON_VERBOSE is set
         
     Returns:
         MinimalState instance
     """
     state = MinimalState(S=S, H=H, B=B)
-    if description:
+    if description and PHARMAKON_VERBOSE:
         print(f"State description: {description}")
     return state
 
@@ -359,13 +694,13 @@ def create_refined_state(
         H_somatic: Physical/arousal capacity [0, 1] - 0=calm, 1=highly activated
         H_cognitive: Executive function capacity [0, 1] - 0=depleted, 1=sharp
         B: Bias baseline [0, 1] - 0=accurate, 1=delusional
-        description: Optional description of this state
+        description: Optional description, printed when PHARMAKON_VERBOSE is set
         
     Returns:
         RefinedState instance
     """
     state = RefinedState(S=S, H_somatic=H_somatic, H_cognitive=H_cognitive, B=B)
-    if description:
+    if description and PHARMAKON_VERBOSE:
         print(f"State description: {description}")
     return state
 
@@ -373,8 +708,85 @@ def create_refined_state(
 # 6. Export/Import
 # ===========================================================================
 
+# Binary layout: S, H, B as little-endian float64 + uint16 format version
+_STATE_STRUCT = struct.Struct('<3dH')
+# Bulk layout header: uint16 format version + uint32 state count
+_STATES_HEADER = struct.Struct('<HI')
+_FORMAT_VERSION = 1
+# Bulk layout version whose block is [N, 3] int8 (one byte per slider)
+_QUANTIZED_FORMAT_VERSION = 2
+
+# Compact slider storage: each [0, 1] value as round(x * 127) in one byte
+DTYPE_SLIDER = np.int8
+_SLIDER_Q_SCALE = 127
+
+def quantize_sliders(x: np.ndarray) -> np.ndarray:
+    """Quantize slider values to DTYPE_SLIDER, clamping to [0, 1]."""
+    x = np.clip(np.asarray(x, dtype=np.float64), 0.0, 1.0)
+    return np.rint(x * _SLIDER_Q_SCALE).astype(DTYPE_SLIDER)
+
+def dequantize_sliders(q: np.ndarray) -> np.ndarray:
+    """Inverse of `quantize_sliders` (exact to within 1/254 per slider)."""
+    return np.asarray(q, dtype=np.float64) / _SLIDER_Q_SCALE
+
 def save_state(state: MinimalState, filepath: Path) -> None:
-    """Save state to JSON file."""
+    """Save state to a fixed-layout 26-byte binary file."""
+    with open(filepath, 'wb') as f:
+        f.write(_STATE_STRUCT.pack(state.S, state.H, state.B, _FORMAT_VERSION))
+
+def load_state(filepath: Path) -> MinimalState:
+    """Load state from a binary file written by `save_state`.
+
+    Files in the legacy JSON format (from `save_state_json` or older
+    releases) are recognised by their leading '{' and loaded as JSON.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read(_STATE_STRUCT.size)
+    if len(data) == _STATE_STRUCT.size:
+        S, H, B, version = _STATE_STRUCT.unpack(data)
+        if version == _FORMAT_VERSION:
+            return MinimalState(S=S, H=H, B=B)
+    # JSON text never contains the version's 0x01 byte, so this cannot shadow a binary save
+    if data.lstrip().startswith(b'{'):
+        return load_state_json(filepath)
+    if len(data) != _STATE_STRUCT.size:
+        raise ValueError(f"{filepath}: expected {_STATE_STRUCT.size} bytes, got {len(data)}")
+    raise ValueError(f"{filepath}: unsupported state format version {version}")
+
+def save_states(states: List[MinimalState], filepath: Path, quantized: bool = False) -> None:
+    """Save many states as one header plus a packed [N, 3] block.
+
+    Args:
+        states: States to save
+        filepath: Output path
+        quantized: Store one int8 byte per slider (3 bytes per state,
+            ±0.004 error) instead of float64
+    """
+    arr = np.array([(s.S, s.H, s.B) for s in states], dtype='<f8').reshape(-1, 3)
+    if quantized:
+        version, arr = _QUANTIZED_FORMAT_VERSION, quantize_sliders(arr)
+    else:
+        version = _FORMAT_VERSION
+    with open(filepath, 'wb') as f:
+        f.write(_STATES_HEADER.pack(version, len(arr)) + arr.tobytes())
+
+def load_states(filepath: Path) -> List[MinimalState]:
+    """Load states written by `save_states` (float64 or quantized)."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    version, n = _STATES_HEADER.unpack_from(data)
+    if version == _FORMAT_VERSION:
+        arr = np.frombuffer(data, dtype='<f8', count=3 * n, offset=_STATES_HEADER.size)
+    elif version == _QUANTIZED_FORMAT_VERSION:
+        arr = dequantize_sliders(
+            np.frombuffer(data, dtype=DTYPE_SLIDER, count=3 * n, offset=_STATES_HEADER.size)
+        )
+    else:
+        raise ValueError(f"{filepath}: unsupported state format version {version}")
+    return MinimalState.batch_from_array(arr.reshape(n, 3))
+
+def save_state_json(state: MinimalState, filepath: Path) -> None:
+    """Save state to JSON file (legacy text format)."""
     data = {
         "S": state.S,
         "H": state.H,
@@ -384,8 +796,8 @@ def save_state(state: MinimalState, filepath: Path) -> None:
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
 
-def load_state(filepath: Path) -> MinimalState:
-    """Load state from JSON file."""
+def load_state_json(filepath: Path) -> MinimalState:
+    """Load state from JSON file (legacy text format)."""
     with open(filepath, 'r') as f:
         data = json.load(f)
     return MinimalState(
@@ -398,7 +810,8 @@ def load_state(filepath: Path) -> MinimalState:
 # 7. Demonstration
 # ===========================================================================
 
-if __name__ == "__main__":
+def _run_demo() -> None:
+    """Print the worked examples (run via `python PHARMAKON_v0.1.py`)."""
     print("=" * 80)
     print("PHARMAKON v0.1 – Minimal 3-Variable Bias Detector")
     print("=" * 80)
@@ -414,11 +827,10 @@ if __name__ == "__main__":
     print("📊 Example 1: Default State")
     state1 = MinimalState()
     print(f"  S={state1.S:.2f}, H={state1.H:.2f}, B={state1.B:.2f}")
-    pos, desc = classify_position(state1)
+    pos, desc, interactions = analyze(state1)
     print(f"  Position: {pos}")
     print(f"  {desc}")
-    interactions = compute_nonlinear_interactions(state1)
-    print(f"  Stability: {interactions['Stability']:.3f}")
+    print(f"  Stability: {interactions.Stability:.3f}")
     print()
     
     # Example 2: Reddit bride (Epistemic Arrogance)
@@ -430,11 +842,10 @@ if __name__ == "__main__":
         description="'MY wedding' - strong identity, high energy, severe bias"
     )
     print(f"  S={state2.S:.2f}, H={state2.H:.2f}, B={state2.B:.2f}")
-    pos, desc = classify_position(state2)
+    pos, desc, interactions = analyze(state2)
     print(f"  Position: {pos}")
     print(f"  {desc}")
-    interactions = compute_nonlinear_interactions(state2)
-    print(f"  Arrogance Risk: {interactions['Arrogance_Risk']:.3f}")
+    print(f"  Arrogance Risk: {interactions.Arrogance_Risk:.3f}")
     print()
     
     # Example 3: Integrated Competence
@@ -446,11 +857,10 @@ if __name__ == "__main__":
         description="Strong identity, high energy, low bias - calibrated"
     )
     print(f"  S={state3.S:.2f}, H={state3.H:.2f}, B={state3.B:.2f}")
-    pos, desc = classify_position(state3)
+    pos, desc, interactions = analyze(state3)
     print(f"  Position: {pos}")
     print(f"  {desc}")
-    interactions = compute_nonlinear_interactions(state3)
-    print(f"  Stability: {interactions['Stability']:.3f}")
+    print(f"  Stability: {interactions.Stability:.3f}")
     print()
     
     # Example 4: Ego dissolution
@@ -462,11 +872,10 @@ if __name__ == "__main__":
         description="Ego death - bias becomes meaningless"
     )
     print(f"  S={state4.S:.2f}, H={state4.H:.2f}, B={state4.B:.2f}")
-    pos, desc = classify_position(state4)
+    pos, desc, interactions = analyze(state4)
     print(f"  Position: {pos}")
     print(f"  {desc}")
-    interactions = compute_nonlinear_interactions(state4)
-    print(f"  Bias Meaningless: {interactions['Bias_Meaningless']:.3f}")
+    print(f"  Bias Meaningless: {interactions.Bias_Meaningless:.3f}")
     print()
     
     # Example 5: Energy collapse
@@ -478,11 +887,10 @@ if __name__ == "__main__":
         description="Energy depleted - everything collapses"
     )
     print(f"  S={state5.S:.2f}, H={state5.H:.2f}, B={state5.B:.2f}")
-    pos, desc = classify_position(state5)
+    pos, desc, interactions = analyze(state5)
     print(f"  Position: {pos}")
     print(f"  {desc}")
-    interactions = compute_nonlinear_interactions(state5)
-    print(f"  Energy Stress: {interactions['Energy_Stress']:.3f}")
+    print(f"  Energy Stress: {interactions.Energy_Stress:.3f}")
     print()
     
     # ========== REFINED STATE EXAMPLES ==========
@@ -573,3 +981,10 @@ if __name__ == "__main__":
     print("  Infinite complexity through nonlinearity")
     print("=" * 80)
 
+
+if __name__ == "__main__" and PHARMAKON_VERBOSE:
+    # Collect the demo output and emit it with a single write
+    _out = io.StringIO()
+    with redirect_stdout(_out):
+        _run_demo()
+    sys.stdout.write(_out.getvalue())
@@ -0,0 +1,66 @@
+"""Round-trips of the v0.1 state file formats."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load_v0_1():
+    name = "PHARMAKON_v0_1"
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, _ROOT / "PHARMAKON_v0.1.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+v01 = _load_v0_1()
+
+
+def test_save_load_state_round_trip(tmp_path):
+    state = v01.MinimalState(S=0.85, H=0.75, B=0.123456789)
+    path = tmp_path / "state.bin"
+    v01.save_state(state, path)
+    assert path.stat().st_size == 26
+    assert v01.load_state(path) == state
+
+
+def test_load_state_reads_legacy_json(tmp_path):
+    state = v01.MinimalState(S=0.7, H=0.6, B=0.5)
+    path = tmp_path / "state.json"
+    v01.save_state_json(state, path)
+    assert v01.load_state(path) == state
+    assert v01.load_state_json(path) == state
+
+
+def test_load_state_rejects_unknown_version(tmp_path):
+    path = tmp_path / "state.bin"
+    path.write_bytes(v01._STATE_STRUCT.pack(0.1, 0.2, 0.3, 99))
+    with pytest.raises(ValueError, match="version 99"):
+        v01.load_state(path)
+
+
+def test_save_load_states_round_trip(tmp_path):
+    states = v01.MinimalState.batch_from_array(np.random.default_rng(0).random((50, 3)))
+    path = tmp_path / "states.bin"
+    v01.save_states(states, path)
+    assert v01.load_states(path) == states
+
+
+def test_save_load_states_quantized(tmp_path):
+    states = v01.MinimalState.batch_from_array(np.random.default_rng(1).random((50, 3)))
+    path = tmp_path / "states.q"
+    v01.save_states(states, path, quantized=True)
+    assert path.stat().st_size == v01._STATES_HEADER.size + 3 * len(states)
+    loaded = v01.load_states(path)
+    assert len(loaded) == len(states)
+    for a, b in zip(loaded, states):
+        assert abs(a.S - b.S) <= 0.5 / 127 + 1e-12
+        assert abs(a.H - b.H) <= 0.5 / 127 + 1e-12
+        assert abs(a.B - b.B) <= 0.5 / 127 + 1e-12
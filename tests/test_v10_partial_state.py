@@ -0,0 +1,112 @@
+"""Partial state dictionaries must score exactly as the original `.get()` code did."""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import PHARMAKON_V10_A as v10
+
+
+def _reference_bias_cascade(state):
+    return sum(state.get(k, 0.0) * w for k, w in v10.WEIGHTS["bias_cascade"].items())
+
+
+def _reference_position(state):
+    dk = state.get("Dunning_Kruger", 0.3)
+    oc = state.get("Overconfidence", 0.3)
+    mc = state.get("Meta_Cognition", 0.5)
+    lu = state.get("Lucidity", 1.0)
+    ro = state.get("Recursive_Overthinking", 0.0)
+    eo = state.get("Ego_Oscillation", 0.0)
+    bias_cascade = _reference_bias_cascade(state)
+    scores = {
+        "Position_1_Epistemic_Arrogance": 0.4 * (dk + oc) / 2.0 + 0.3 * (1.0 - mc) + 0.3 * (1.0 - lu),
+        "Position_2_Meta_Awareness_Trap": 0.3 * mc + 0.3 * lu + 0.2 * ro + 0.2 * bias_cascade,
+        "Position_3_Integrated_Competence": 0.3 * mc + 0.3 * lu + 0.2 * (1.0 - ro) + 0.2 * (1.0 - eo),
+    }
+    return max(scores, key=scores.get).replace("_", " "), scores
+
+
+def _reference_flags(state):
+    narrative_risk = 1.0 - (
+        0.4 * state.get("Coherence", 0.7) +
+        0.3 * state.get("Continuity", 0.7) +
+        0.3 * state.get("Arc", 0.5)
+    )
+    return {
+        "Bias_Cascade": (
+            _reference_bias_cascade(state) > 0.6 and state.get("Delusionality", 0.0) > 0.4
+        ),
+        "Narrative_Collapse": narrative_risk > 0.7,
+        "Moral_Rigidity": (
+            state.get("Dogma_Fixation", 0.0) > 0.7 and state.get("Protagonist", 0.6) > 0.7
+        ),
+    }
+
+
+def test_empty_state_composites_are_zero():
+    assert v10.compute_composites({}) == {name: 0.0 for name in v10.WEIGHTS}
+    assert v10.compute_composite("bias_cascade", {}) == 0.0
+    assert v10.compute_composites(v10.StateVector.from_dict({})) == {name: 0.0 for name in v10.WEIGHTS}
+
+
+def test_partial_state_bias_cascade_not_padded():
+    state = {"Delusionality": 0.9, "Dunning_Kruger": 0.9, "Overconfidence": 0.9, "Hindsight": 0.9}
+    assert v10.detect_flags(state)["Bias_Cascade"] is False
+
+
+def test_random_partial_states_match_reference():
+    rng = random.Random(0)
+    for _ in range(2000):
+        keys = rng.sample(v10.STATE_KEYS, rng.randint(0, len(v10.STATE_KEYS)))
+        state = {k: rng.random() for k in keys}
+
+        composites = v10.compute_composites(state)
+        for name in v10.WEIGHTS:
+            assert composites[name] == v10.compute_composite(name, state)
+
+        position, scores = v10.classify_triangle_position(state)
+        ref_position, ref_scores = _reference_position(state)
+        assert position == ref_position
+        for k, ref in ref_scores.items():
+            assert abs(scores[k] - ref) < 1e-12
+
+        assert v10.detect_flags(state) == _reference_flags(state)
+
+
+def _reference_derivatives(t, y, state_keys):
+    state = dict(zip(state_keys, y))
+    dy = np.zeros_like(y)
+    idx = {k: i for i, k in enumerate(state_keys)}
+    if "Fear" in idx:
+        dy[idx["Fear"]] = -0.1 * state["Fear"]
+    if "Joy" in idx:
+        pos = sum(state.get(k, 0.0) * w for k, w in v10.WEIGHTS["positive"].items())
+        dy[idx["Joy"]] = 0.05 * pos - 0.02 * state["Joy"]
+    if "Ego_Oscillation" in idx and "Lucidity" in idx:
+        dy[idx["Ego_Oscillation"]] = (
+            0.1 * state.get("Recursive_Overthinking", 0.0) - 0.05 * state["Lucidity"]
+        )
+    if "Meta_Cognition" in idx and "Confirmation" in idx:
+        bias_awareness = state["Meta_Cognition"] * (1 - _reference_bias_cascade(state))
+        dy[idx["Meta_Cognition"]] = 0.1 * bias_awareness
+        dy[idx["Confirmation"]] = -0.05 * bias_awareness
+    return dy
+
+
+def test_partial_state_trajectory_matches_reference():
+    state = {"Fear": 0.8, "Joy": 0.2, "Meta_Cognition": 0.5, "Confirmation": 0.6,
+             "Lucidity": 0.7, "Ego_Oscillation": 0.5}
+    keys = sorted(state)
+    ref = solve_ivp(lambda t, y: _reference_derivatives(t, y, keys), (0, 10),
+                    [state[k] for k in keys], t_eval=np.linspace(0, 10, 20))
+    # Agreement is to solver tolerance: the padded rows change RK45's step control
+    for method in ("RK45", "RK4"):
+        _, y = v10.simulate_trajectory(state, t_span=(0, 10), n_points=20, method=method)
+        for row, k in enumerate(keys):
+            assert np.allclose(y[v10.SliderIndex[k]], ref.y[row], atol=1e-3)